@@ -85,6 +85,14 @@ def test_number_conversion_if_inflect_available():
         pytest.skip("inflect not available")
 
 
+def test_inflect_engine_is_reused():
+    if not INFLECT_AVAILABLE:
+        pytest.skip("inflect not available")
+    from wikibee import formatting
+
+    assert formatting._inflect_engine() is formatting._inflect_engine()
+
+
 def test_extract_raises_network_error_when_requested():
     class BadSession:
         def get(self, url, params=None, timeout=None):
@@ -342,6 +342,10 @@ class TestEdgeCases:
         """Test normalization of empty text."""
         assert normalize_for_tts("") == ""
 
+    def test_whitespace_only_text(self):
+        """Test that whitespace-only text is returned unchanged."""
+        assert normalize_for_tts("  \n\t ") == "  \n\t "
+
     def test_no_matching_patterns(self):
         """Test text with no patterns to normalize."""
         text = "This is plain text with no special patterns."
@@ -127,3 +127,15 @@ def test_streaming_raises_and_bubbles(monkeypatch, tmp_path):
     client = TTSOpenAIClient()
     with pytest.raises(TTSClientError):
         client.synthesize_to_file("hi", dest_path=str(tmp_path / "out.mp3"))
+
+
+def test_import_does_not_load_openai():
+    # the openai package is only imported on first synthesis
+    import subprocess
+    import sys
+
+    code = "import sys, wikibee.tts_openai; print('openai' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
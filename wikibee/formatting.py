@@ -1,17 +1,36 @@
 from __future__ import annotations
 
+import functools
+import importlib.util
 import re
 from typing import Optional
 from urllib.parse import unquote
 
-try:
-    import inflect as _inflect
+# `inflect` is slow to import, so only probe for it here and build the engine
+# on first use (see `_inflect_engine`).
+INFLECT_AVAILABLE = importlib.util.find_spec("inflect") is not None
 
-    _INFLECT_ENGINE = _inflect.engine()
-    INFLECT_AVAILABLE = True
-except Exception:
-    _INFLECT_ENGINE = None
-    INFLECT_AVAILABLE = False
+
+@functools.lru_cache(maxsize=1)
+def _inflect_engine():
+    import inflect
+
+    return inflect.engine()
+
+
+# Regexes used on every call are compiled once at import.
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f]")
+_FILENAME_UNSAFE_RE = re.compile(r'[\\/*?:"<>|]')
+_WHITESPACE_RE = re.compile(r"\s+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n+")
+_LIST_MARKER_RE = re.compile(r"^\s*[\*#]\s+", re.MULTILINE)
+_WIKI_HEADING_RE = re.compile(r"^==+\s*(.*?)\s*==+\s*$", re.MULTILINE)
+_NUMBER_RE = re.compile(r"\b(\d+)\b")
+_MD_HEADING_RE = re.compile(r"^\s*(?P<hashes>#+)\s*(?P<title>.+?)\s*$")
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\([^\)]+\)")
+_MD_EMPHASIS_RE = re.compile(r"[*_]{1,3}(.+?)[*_]{1,3}")
+_MD_CODE_RE = re.compile(r"`(.+?)`")
+_MD_HEADING_MARKER_RE = re.compile(r"^\s*#+\s*")
 
 
 def sanitize_filename(name: str, max_len: int = 100) -> str:
@@ -23,9 +42,9 @@ def sanitize_filename(name: str, max_len: int = 100) -> str:
     except Exception:
         pass
 
-    name = re.sub(r"[\x00-\x1f\x7f]", "", name)
-    name = re.sub(r'[\\/*?:"<>|]', "", name)
-    name = re.sub(r"\s+", "_", name)
+    name = _CONTROL_CHARS_RE.sub("", name)
+    name = _FILENAME_UNSAFE_RE.sub("", name)
+    name = _WHITESPACE_RE.sub("_", name)
     name = name.strip(" .")
 
     if not name:
@@ -58,16 +77,14 @@ def normalize_for_tts(text: str, convert_numbers: bool = False) -> str:
         return ""
 
     text = text.strip()
-    text = re.sub(r"\n\s*\n+", "\n\n", text)
-    text = re.sub(r"^\s*[\*#]\s+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^==+\s*(.*?)\s*==+\s*$", "", text, flags=re.MULTILINE).strip()
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    text = _LIST_MARKER_RE.sub("", text)
+    text = _WIKI_HEADING_RE.sub("", text).strip()
 
     if convert_numbers and INFLECT_AVAILABLE:
         try:
-            import inflect
-
-            p = inflect.engine()
-            text = re.sub(r"\b(\d+)\b", lambda m: p.number_to_words(m.group(1)), text)
+            p = _inflect_engine()
+            text = _NUMBER_RE.sub(lambda m: p.number_to_words(m.group(1)), text)
         except Exception:
             pass
 
@@ -77,7 +94,7 @@ def normalize_for_tts(text: str, convert_numbers: bool = False) -> str:
 def make_tts_friendly(markdown: str, heading_prefix: Optional[str] = None) -> str:
     out_lines: list[str] = []
     for line in markdown.splitlines():
-        m = re.match(r"^\s*(?P<hashes>#+)\s*(?P<title>.+?)\s*$", line)
+        m = _MD_HEADING_RE.match(line)
         if m:
             title = m.group("title").strip()
             if heading_prefix:
@@ -86,14 +103,14 @@ def make_tts_friendly(markdown: str, heading_prefix: Optional[str] = None) -> st
                 out_lines.append(f"{title}.")
             continue
 
-        line = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", line)
-        line = re.sub(r"[*_]{1,3}(.+?)[*_]{1,3}", r"\1", line)
-        line = re.sub(r"`(.+?)`", r"\1", line)
-        line = re.sub(r"^\s*#+\s*", "", line)
+        line = _MD_LINK_RE.sub(r"\1", line)
+        line = _MD_EMPHASIS_RE.sub(r"\1", line)
+        line = _MD_CODE_RE.sub(r"\1", line)
+        line = _MD_HEADING_MARKER_RE.sub("", line)
         out_lines.append(line)
 
     text = "\n".join(out_lines)
-    text = re.sub(r"\n\s*\n+", "\n\n", text).strip() + "\n"
+    text = _BLANK_LINES_RE.sub("\n\n", text).strip() + "\n"
     return text
 
 
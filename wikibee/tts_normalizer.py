@@ -7,7 +7,74 @@ analysis of Wikipedia articles across history, computer science, and mathematics
 
 import re
 
-from num2words import num2words
+
+def num2words(number, **kwargs) -> str:
+    """Spell out ``number``, importing `num2words` only on first use.
+
+    The import is deferred so that loading the CLI does not pay for it when
+    ``--tts-normalize`` is not requested.
+    """
+    from num2words import num2words as _num2words
+
+    return _num2words(number, **kwargs)
+
+
+# Patterns and lookup tables are compiled once at import rather than rebuilt
+# on every normalization pass.
+
+_ROMAN_VALUES = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100, "D": 500, "M": 1000}
+
+# Basic pattern for valid Roman numerals; catches common invalid patterns
+# like XIIII, VVIII, IIII
+_VALID_ROMAN_RE = re.compile(
+    r"^M{0,4}(CM|CD|D?C{0,3})(XL|XC|L?X{0,3})(IX|IV|V?I{0,3})$"
+)
+
+# Name + space + Roman numeral; restrictive so it typically hits person names
+_ROYAL_NAME_RE = re.compile(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+([IVX]+)\b")
+
+# Number + ordinal suffix (st, nd, rd, th)
+_ORDINAL_RE = re.compile(r"\b(\d+)(st|nd|rd|th)\b")
+
+# Latin abbreviations and their spoken expansions, applied in order
+_LATIN_ABBREVIATIONS = [
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in (
+        (r"\be\.g\.,", r"for example"),  # e.g., → for example (remove comma)
+        (r"\be\.g\.", r"for example"),  # e.g. → for example
+        (r"\bi\.e\.,", r"that is"),  # i.e., → that is (remove comma)
+        (r"\bi\.e\.", r"that is"),  # i.e. → that is
+        (r"\betc\.", r"et cetera"),  # etc. → et cetera
+        (r"\bc\.\s*(\d{4})", r"circa \1"),  # c. 1943 → circa 1943
+    )
+]
+
+# 4-digit year + 's'
+_DECADE_RE = re.compile(r"\b(\d{4})s\b")
+
+# Decade digit to word with -ies ending
+_DECADE_NAMES = {
+    1: "tens",
+    2: "twenties",
+    3: "thirties",
+    4: "forties",
+    5: "fifties",
+    6: "sixties",
+    7: "seventies",
+    8: "eighties",
+    9: "nineties",
+}
+
+# Specific war patterns, applied in order
+_WAR_PATTERNS = [
+    (re.compile(pattern), replacement)
+    for pattern, replacement in (
+        (r"\bWorld War II\b", "World War Two"),
+        (r"\bWorld War I\b", "World War One"),
+        (r"\bWWII\b", "World War Two"),
+        (r"\bWWI\b", "World War One"),
+    )
+]
 
 
 class TTSNormalizer:
@@ -41,6 +108,10 @@ class TTSNormalizer:
         Returns:
             Normalized text with better TTS pronunciation
         """
+        # Blank input cannot match any pattern; skip the regex passes.
+        if not text or text.isspace():
+            return text
+
         if phase == "phase1":
             patterns = self.phase1_patterns
         elif phase == "phase2":
@@ -61,13 +132,11 @@ class TTSNormalizer:
         if not self._is_valid_roman(roman):
             raise ValueError(f"Invalid Roman numeral: {roman}")
 
-        values = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100, "D": 500, "M": 1000}
-
         total = 0
         prev = 0
 
         for char in reversed(roman):
-            value = values.get(char, 0)
+            value = _ROMAN_VALUES.get(char, 0)
             if value < prev:
                 total -= value
             else:
@@ -78,12 +147,7 @@ class TTSNormalizer:
 
     def _is_valid_roman(self, roman: str) -> bool:
         """Check if Roman numeral is properly formed."""
-        # Basic pattern for valid Roman numerals I-L (1-50)
-        # This catches common invalid patterns like XIIII, VVIII, IIII
-        valid_pattern = r"^M{0,4}(CM|CD|D?C{0,3})(XL|XC|L?X{0,3})(IX|IV|V?I{0,3})$"
-        import re
-
-        return bool(re.match(valid_pattern, roman))
+        return bool(_VALID_ROMAN_RE.match(roman))
 
     def _normalize_royal_names(self, text: str) -> str:
         """Convert royal/historical names with Roman numerals.
@@ -113,10 +177,7 @@ class TTSNormalizer:
             except (ValueError, TypeError):
                 return match.group(0)  # Return original if conversion fails
 
-        # Pattern: Name + space + Roman numeral (I-L, covers 1-50)
-        # More restrictive pattern - typically person names
-        pattern = r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+([IVX]+)\b"
-        return re.sub(pattern, replace_royal, text)
+        return _ROYAL_NAME_RE.sub(replace_royal, text)
 
     def _normalize_century_ordinals(self, text: str) -> str:
         """Convert ordinal numbers to word form.
@@ -137,9 +198,7 @@ class TTSNormalizer:
             except (ValueError, TypeError):
                 return match.group(0)  # Return original if conversion fails
 
-        # Pattern: number + ordinal suffix (st, nd, rd, th)
-        pattern = r"\b(\d+)(st|nd|rd|th)\b"
-        return re.sub(pattern, replace_ordinal, text)
+        return _ORDINAL_RE.sub(replace_ordinal, text)
 
     def _normalize_latin_abbreviations(self, text: str) -> str:
         """Convert common Latin abbreviations to spoken form.
@@ -149,19 +208,9 @@ class TTSNormalizer:
             i.e. → that is
             etc. → et cetera
         """
-        # Dictionary of abbreviations to expansions
-        abbreviations = {
-            r"\be\.g\.,": r"for example",  # e.g., → for example (remove comma)
-            r"\be\.g\.": r"for example",  # e.g. → for example
-            r"\bi\.e\.,": r"that is",  # i.e., → that is (remove comma)
-            r"\bi\.e\.": r"that is",  # i.e. → that is
-            r"\betc\.": r"et cetera",  # etc. → et cetera
-            r"\bc\.\s*(\d{4})": r"circa \1",  # c. 1943 → circa 1943
-        }
-
         result = text
-        for pattern, replacement in abbreviations.items():
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+        for pattern, replacement in _LATIN_ABBREVIATIONS:
+            result = pattern.sub(replacement, result)
 
         return result
 
@@ -198,18 +247,7 @@ class TTSNormalizer:
                         # 1980s → nineteen eighties
                         century_word = num2words(century)
                         # Convert decade digit to proper word with -ies ending
-                        decade_names = {
-                            1: "tens",
-                            2: "twenties",
-                            3: "thirties",
-                            4: "forties",
-                            5: "fifties",
-                            6: "sixties",
-                            7: "seventies",
-                            8: "eighties",
-                            9: "nineties",
-                        }
-                        decade_word = decade_names.get(
+                        decade_word = _DECADE_NAMES.get(
                             decade, f"{num2words(decade * 10)}s"
                         )
                         return f"{century_word} {decade_word}"
@@ -219,9 +257,7 @@ class TTSNormalizer:
             except (ValueError, TypeError):
                 return match.group(0)
 
-        # Pattern: 4-digit year + 's'
-        pattern = r"\b(\d{4})s\b"
-        return re.sub(pattern, replace_decade, text)
+        return _DECADE_RE.sub(replace_decade, text)
 
     def _normalize_war_numbering(self, text: str) -> str:
         """Convert war numbering to spoken form.
@@ -230,17 +266,9 @@ class TTSNormalizer:
             World War II → World War Two
             World War I → World War One
         """
-        # Specific war patterns
-        war_patterns = {
-            r"\bWorld War II\b": "World War Two",
-            r"\bWorld War I\b": "World War One",
-            r"\bWWII\b": "World War Two",
-            r"\bWWI\b": "World War One",
-        }
-
         result = text
-        for pattern, replacement in war_patterns.items():
-            result = re.sub(pattern, replacement, result)
+        for pattern, replacement in _WAR_PATTERNS:
+            result = pattern.sub(replacement, result)
 
         return result
 
@@ -2,13 +2,10 @@ from __future__ import annotations
 
 from typing import Optional
 
-# Allow tests to monkeypatch `OpenAI` at module level without requiring the
-# real `openai` package to be installed at import time. If the import fails
-# we'll set OpenAI to None and import inside the constructor.
-try:
-    from openai import OpenAI  # type: ignore
-except Exception:  # pragma: no cover - import-time fallback
-    OpenAI = None
+# `openai` is heavy to import and only needed when audio is requested, so
+# the real class is imported lazily on first synthesis. Tests can still
+# monkeypatch `OpenAI` at module level to bypass the import entirely.
+OpenAI = None
 
 
 class TTSClientError(RuntimeError):
@@ -51,7 +48,7 @@ class TTSOpenAIClient:
                 if OpenAI is None:
                     try:
                         from openai import OpenAI as _OpenAI  # type: ignore
-                    except Exception as e:  # pragma: no cover - tests monkeypatch
+                    except Exception as e:  # pragma: no cover - import-time failure
                         raise TTSClientError(
                             "OpenAI client is not available; install 'openai' or"
                             " monkeypatch OpenAI in tests"